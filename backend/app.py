@@ -1,6 +1,7 @@
 from flask import Flask, request, jsonify, send_file
-from extractor import download_video, extract, frames_to_pdf, VideoDownloadError
+from extractor import download_video, extract, extract_preview, frames_to_pdf, VideoDownloadError
 from flask_cors import CORS
+from pdf_cache import PdfCache
 import cv2
 import os
 import base64
@@ -15,7 +16,8 @@ import time
 
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*",
-     "methods": ["GET", "POST", "OPTIONS"]}})
+     "methods": ["GET", "POST", "OPTIONS"],
+     "expose_headers": ["ETag", "Last-Modified", "Content-Location"]}})
 
 # Get absolute path to backend directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -28,6 +30,27 @@ if not os.path.exists(DOWNLOADS_DIR):
 # Store download tasks
 download_tasks = {}
 
+# Cache of generated PDFs, bounded by PDF_CACHE_MAX_MB (default 500 MB)
+PDF_CACHE_DIR = os.path.join(BASE_DIR, 'pdf_cache')
+pdf_cache = PdfCache(
+    PDF_CACHE_DIR,
+    max_bytes=int(os.environ.get('PDF_CACHE_MAX_MB', 500)) * 1024 * 1024)
+
+
+def send_cached_pdf(key, path):
+    """Stream a cached PDF with ETag/Last-Modified so repeats can get a 304."""
+    response = send_file(
+        path,
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name='sheet_music.pdf',
+        conditional=True,
+        etag=key,
+        max_age=0
+    )
+    response.headers['Content-Location'] = f'/api/video/result/{key}'
+    return response
+
 
 def cleanup_old_files():
     """Delete files older than 1 hour to prevent disk fill-up."""
@@ -169,32 +192,102 @@ def extract_frames():
         frame_width_percent = int(data.get('frameWidthPercent', 95))
         gap = int(data.get('gap', 10))
 
-        # Extract frames
-        frames = extract(filename, x1, y1, x2, y2, start, end, interval)
+        video_path = os.path.join(DOWNLOADS_DIR, filename)
+        if not os.path.exists(video_path):
+            return jsonify({'error': f'Video file not found: {filename}'}), 404
+
+        key = pdf_cache.make_key(video_path, {
+            'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
+            'start': start, 'end': end, 'interval': interval,
+            'framesPerPage': frames_per_page,
+            'frameWidthPercent': frame_width_percent,
+            'gap': gap,
+        })
+
+        # Werkzeug only answers 304 for GET/HEAD, so check the ETag ourselves
+        if key in request.if_none_match and pdf_cache.get(key):
+            response = app.response_class(status=304)
+            response.set_etag(key)
+            response.headers['Content-Location'] = f'/api/video/result/{key}'
+            return response
+
+        def render():
+            # Extract frames
+            frames = extract(filename, x1, y1, x2, y2, start, end, interval)
+
+            if not frames:
+                return None
+
+            # Convert to PDF with vertical stacking layout
+            return frames_to_pdf(
+                frames,
+                frames_per_page=frames_per_page,
+                frame_width_percent=frame_width_percent,
+                gap=gap
+            )
+
+        path = pdf_cache.get_or_create(key, render)
+
+        if not path:
+            return jsonify({'error': 'Failed to generate PDF'}), 500
 
-        if not frames:
-            return jsonify({'error': 'No frames extracted'}), 400
+        return send_cached_pdf(key, path)
 
-        # Convert to PDF with vertical stacking layout
-        pdf_bytes = frames_to_pdf(
-            frames,
-            frames_per_page=frames_per_page,
-            frame_width_percent=frame_width_percent,
-            gap=gap
-        )
+    except Exception as e:
+        return jsonify({'error': f'Extraction failed: {str(e)}'}), 500
 
-        if not pdf_bytes:
-            return jsonify({'error': 'Failed to generate PDF'}), 500
 
-        return send_file(
-            pdf_bytes,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name='sheet_music.pdf'
-        )
+@app.route('/api/video/result/<key>', methods=['GET'])
+def get_cached_result(key):
+    """Serve a previously generated PDF by cache key, honouring conditional GETs."""
+    if len(key) != 64 or any(c not in '0123456789abcdef' for c in key):
+        return jsonify({'error': 'Invalid result key'}), 400
+
+    path = pdf_cache.get(key)
+    if not path:
+        return jsonify({'error': 'Result not found or expired'}), 404
+
+    return send_cached_pdf(key, path)
+
+
+@app.route('/api/video/extract-preview', methods=['POST'])
+def extract_preview_frames():
+    """Dry run of /api/video/extract: return sampled timestamps with small JPEG thumbnails."""
+    try:
+        data = request.json
+
+        filename = data.get('filename')
+        x1 = int(data.get('x1', 0))
+        y1 = int(data.get('y1', 0))
+        x2 = int(data.get('x2', 0))
+        y2 = int(data.get('y2', 0))
+        start = int(data.get('start', 0))
+        end = int(data.get('end', 0))
+        interval = int(data.get('interval', 1000))
+        thumb_width = int(data.get('thumbWidth', 320))
+
+        if interval <= 0:
+            return jsonify({'error': 'Interval must be positive'}), 400
+        if thumb_width <= 0:
+            return jsonify({'error': 'Thumbnail width must be positive'}), 400
+
+        thumbnails = extract_preview(
+            filename, x1, y1, x2, y2, start, end, interval,
+            thumb_width=thumb_width)
+
+        return jsonify({
+            'count': len(thumbnails),
+            'frames': [
+                {
+                    'time': time,
+                    'data': 'data:image/jpeg;base64,' + base64.b64encode(jpeg).decode('ascii')
+                }
+                for time, jpeg in thumbnails
+            ]
+        })
 
     except Exception as e:
-        return jsonify({'error': f'Extraction failed: {str(e)}'}), 500
+        return jsonify({'error': f'Preview failed: {str(e)}'}), 500
 
 
 @app.route('/api/video/extract-from-frames', methods=['POST'])
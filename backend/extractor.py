@@ -144,45 +144,76 @@ def download_video(vid_url, progress_callback=None):
             f"Error downloading video at {vid_url}: {str(e)}")
 
 
-def extract(file_name, x1, y1, x2, y2, start, end, interval):
+def _sample_frames(file_name, x1, y1, x2, y2, start, end, interval):
+    """Yield (time_ms, cropped_frame) pairs for every sampled timestamp."""
     video_file_path = os.path.join(DOWNLOADS_DIR, file_name)
 
     if not os.path.exists(video_file_path):
         raise FileNotFoundError(f"Video file not found: {video_file_path}")
 
-    result = []
     video = cv2.VideoCapture(video_file_path)
 
     if not video.isOpened():
         raise ValueError("Failed to open video file")
 
-    # Get video dimensions for validation
-    frame_width = int(video.get(cv2.CAP_PROP_FRAME_WIDTH))
-    frame_height = int(video.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-    # Validate crop coordinates
-    if x1 < 0 or y1 < 0 or x2 > frame_width or y2 > frame_height:
+    try:
+        # Get video dimensions for validation
+        frame_width = int(video.get(cv2.CAP_PROP_FRAME_WIDTH))
+        frame_height = int(video.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        # Validate crop coordinates
+        if x1 < 0 or y1 < 0 or x2 > frame_width or y2 > frame_height:
+            raise ValueError(
+                f"Crop coordinates out of bounds. Video size: {frame_width}x{frame_height}, Crop: ({x1},{y1}) to ({x2},{y2})")
+
+        if x1 >= x2 or y1 >= y2:
+            raise ValueError(
+                f"Invalid crop coordinates: ({x1},{y1}) to ({x2},{y2})")
+
+        for time in range(start, end, interval):
+            video.set(cv2.CAP_PROP_POS_MSEC, time)
+            success, img = video.read()
+            if success and img is not None:
+                cropped_img = img[y1:y2, x1:x2]
+                # Verify cropped image is not empty
+                if cropped_img.size > 0:
+                    yield time, cropped_img
+                else:
+                    print(f"Warning: Empty crop at time {time}ms")
+    finally:
         video.release()
-        raise ValueError(
-            f"Crop coordinates out of bounds. Video size: {frame_width}x{frame_height}, Crop: ({x1},{y1}) to ({x2},{y2})")
 
-    if x1 >= x2 or y1 >= y2:
-        video.release()
+
+def extract(file_name, x1, y1, x2, y2, start, end, interval):
+    result = [img for _, img in _sample_frames(
+        file_name, x1, y1, x2, y2, start, end, interval)]
+
+    if not result:
         raise ValueError(
-            f"Invalid crop coordinates: ({x1},{y1}) to ({x2},{y2})")
-
-    for time in range(start, end, interval):
-        video.set(cv2.CAP_PROP_POS_MSEC, time)
-        success, img = video.read()
-        if success and img is not None:
-            cropped_img = img[y1:y2, x1:x2]
-            # Verify cropped image is not empty
-            if cropped_img.size > 0:
-                result.append(cropped_img)
-            else:
-                print(f"Warning: Empty crop at time {time}ms")
-
-    video.release()
+            "No frames were extracted. Check your time range and crop coordinates.")
+
+    return result
+
+
+def extract_preview(file_name, x1, y1, x2, y2, start, end, interval, thumb_width=320, quality=70):
+    """Run the same sampling as extract() but return small JPEG thumbnails.
+
+    Returns a list of (time_ms, jpeg_bytes) tuples, one per frame that the
+    full extraction would put into the PDF.
+    """
+    result = []
+    for time, img in _sample_frames(file_name, x1, y1, x2, y2, start, end, interval):
+        height, width = img.shape[:2]
+        if width > thumb_width:
+            thumb_height = max(1, int(height * thumb_width / width))
+            img = cv2.resize(img, (thumb_width, thumb_height),
+                             interpolation=cv2.INTER_AREA)
+        success, buf = cv2.imencode(
+            '.jpg', img, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        if success:
+            result.append((time, buf.tobytes()))
+        else:
+            print(f"Warning: Failed to encode thumbnail at time {time}ms")
 
     if not result:
         raise ValueError(
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+
+# Bump when frames_to_pdf output changes so stale PDFs are not served
+CACHE_VERSION = 1
+
+
+class PdfCache:
+    """Disk-backed, size-bounded cache of generated PDFs keyed by request hash.
+
+    Entries are evicted least-recently-used first (by file atime, which is
+    refreshed on every hit) once the total size exceeds max_bytes. The file
+    mtime is left alone so it can serve as a stable Last-Modified.
+    Concurrent requests for the same key wait for the first one to finish
+    instead of rendering the same PDF twice.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, video_path, params):
+        """Hash the video identity and extraction parameters into a canonical key."""
+        stat = os.stat(video_path)
+        payload = {
+            'version': CACHE_VERSION,
+            'video': os.path.basename(video_path),
+            'size': stat.st_size,
+            'mtime': int(stat.st_mtime),
+            'params': params,
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def get(self, key):
+        """Return the cached file path for key, or None if not cached."""
+        path = self.path_for(key)
+        try:
+            # Refresh atime so eviction treats this entry as recently used
+            stat = os.stat(path)
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            return None
+        return path
+
+    def get_or_create(self, key, render):
+        """Return the cached path for key, calling render() to produce it if missing.
+
+        render() must return a file-like object with the PDF bytes, or None
+        on failure (in which case None is returned and nothing is cached).
+        """
+        while True:
+            path = self.get(key)
+            if path:
+                return path
+
+            with self._lock:
+                event = self._in_flight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._in_flight[key] = event
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # Another request is rendering this PDF; wait and re-check
+                event.wait()
+                continue
+
+            try:
+                # The previous owner may have finished between get() and the lock
+                path = self.get(key)
+                if path:
+                    return path
+
+                pdf_bytes = render()
+                if not pdf_bytes:
+                    return None
+                return self._store(key, pdf_bytes)
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                event.set()
+
+    def _store(self, key, pdf_bytes):
+        path = self.path_for(key)
+        tmp_path = os.path.join(self.cache_dir, f".{uuid.uuid4()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(pdf_bytes.getvalue())
+        # Atomic rename so readers never see a partially written PDF
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, keep=None):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.pdf'):
+                continue
+            file_path = os.path.join(self.cache_dir, filename)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, file_path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, file_path in entries:
+            if total <= self.max_bytes:
+                break
+            if file_path == keep:
+                continue
+            try:
+                os.remove(file_path)
+                total -= size
+                print(f"Evicted cached PDF: {os.path.basename(file_path)}")
+            except OSError as e:
+                print(f"Error evicting {file_path}: {e}")